@@ -1,6 +1,13 @@
+import asyncio
 import logging
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobServiceClient
 
@@ -10,12 +17,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class AzureStorage:
-    def __init__(self, config: dict[str, str]):
+    def __init__(self, config: dict[str, str], max_workers: int = 8):
         self._config = config
+        self._max_workers = max_workers
         self._blob_client = None
 
+        # Threads for the async methods; the HTTP connection pool is sized to
+        # match so every concurrent call can reuse a pooled connection.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="azure_storage"
+        )
+
     @property
     def blob_client(self) -> BlobServiceClient:
         if self._blob_client is None:
@@ -25,9 +41,13 @@ class AzureStorage:
 
             credential = DefaultAzureCredential()
             account_url = f"https://{account_name}.blob.core.windows.net"
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_maxsize=self._max_workers))
             try:
                 self._blob_client = BlobServiceClient(
-                    account_url=account_url, credential=credential
+                    account_url=account_url,
+                    credential=credential,
+                    session=session,
                 )
             except Exception as e:
                 logger.exception("Failed to create Azure Blob client")
@@ -54,6 +74,22 @@ class AzureStorage:
         logger.info("File downloaded successfully: %s", tmp_file_path)
         return str(tmp_file_path)
 
+    def download_bytes(self, container_name: str, blob_name: str) -> bytes:
+        try:
+            blob = self.blob_client.get_blob_client(
+                container=container_name, blob=blob_name
+            )
+            data = blob.download_blob(max_concurrency=8).readall()
+        except Exception as e:
+            logger.exception(f"Failed to download blob '{blob_name}'")
+            raise RuntimeError(f"Download failed for blob '{blob_name}'") from e
+
+        logger.info("Blob downloaded successfully: %s", blob_name)
+        return data
+
+    async def download_bytes_async(self, container_name: str, blob_name: str) -> bytes:
+        return await self._run_in_thread(self.download_bytes, container_name, blob_name)
+
     def upload_bytes(self, container_name: str, blob_name: str, data: bytes) -> str:
         try:
             blob = self.blob_client.get_blob_client(
@@ -67,3 +103,20 @@ class AzureStorage:
         blob_url = blob.url
         logger.info("Data uploaded successfully: %s", blob_url)
         return blob_url
+
+    async def upload_bytes_async(
+        self, container_name: str, blob_name: str, data: bytes
+    ) -> str:
+        return await self._run_in_thread(
+            self.upload_bytes, container_name, blob_name, data
+        )
+
+    async def _run_in_thread(self, func: Callable[..., T], *args) -> T:
+        # Resolve the lazily created client on the event loop thread so
+        # concurrent calls don't race to initialize it.
+        _ = self.blob_client
+        # Use a dedicated pool so storage calls neither compete with other
+        # to_thread users nor exceed the connection pool size.
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
@@ -8,7 +8,11 @@ from temporalio.client import Client
 from temporalio.worker import Worker
 
 from azure_storage import AzureStorage
-from workers.indexer_activities import IndexerActivities
+from workers.indexer_activities import (
+    DOWNLOAD_PREFETCH,
+    UPLOAD_CONCURRENCY,
+    IndexerActivities,
+)
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -24,7 +28,9 @@ async def main():
     config.read("config.ini")
     env_config = dict(config[run_mode])
 
-    azure_storage = AzureStorage(env_config)
+    azure_storage = AzureStorage(
+        env_config, max_workers=UPLOAD_CONCURRENCY + DOWNLOAD_PREFETCH
+    )
     activities = IndexerActivities(env_config, azure_storage)
 
     temporal_host = env_config["temporal_host_port"]
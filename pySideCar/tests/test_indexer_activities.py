@@ -0,0 +1,146 @@
+import asyncio
+import unittest
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import orjson
+
+from workers.indexer_activities import IndexerActivities
+from workers.indexer_types import Chunk
+
+
+def section_json(chunk_id: str, windows: int) -> bytes:
+    # The fake chunker reads the window count from the section title.
+    return Chunk(
+        chunkId=chunk_id,
+        title=str(windows),
+        sectionPath="path",
+        sectionIndex=0,
+        sourceUri="source.md",
+        sentences=["body"],
+        prevChunkId="",
+        nextChunkId="",
+        sectionId=chunk_id,
+        windowIndex=0,
+    ).to_json_bytes()
+
+
+class FakeWindowChunker:
+    def chunk_windows(self, section_chunk: Chunk) -> Iterator[Chunk]:
+        for w_idx in range(int(section_chunk.title)):
+            yield Chunk(
+                chunkId=f"{section_chunk.chunkId}_{w_idx}",
+                title=section_chunk.title,
+                sectionPath=section_chunk.sectionPath,
+                sectionIndex=section_chunk.sectionIndex,
+                sourceUri=section_chunk.sourceUri,
+                sentences=section_chunk.sentences,
+                prevChunkId="",
+                nextChunkId="",
+                sectionId=section_chunk.sectionId,
+                windowIndex=w_idx,
+            )
+
+
+class FakeAzureStorage:
+    def __init__(self, sections: dict[str, bytes], fail_uploads: bool = False):
+        self.sections = sections
+        self.fail_uploads = fail_uploads
+        self.containers: set[str] = set()
+        self.downloaded: list[str] = []
+        self.uploaded: dict[str, dict] = {}
+
+    async def download_bytes_async(self, container_name: str, blob_name: str) -> bytes:
+        await asyncio.sleep(0)
+        self.containers.add(container_name)
+        self.downloaded.append(blob_name)
+        return self.sections[blob_name]
+
+    async def upload_bytes_async(
+        self, container_name: str, blob_name: str, data: bytes
+    ) -> str:
+        await asyncio.sleep(0)
+        self.containers.add(container_name)
+        if self.fail_uploads:
+            raise RuntimeError(f"Upload failed for blob '{blob_name}'")
+        self.uploaded[blob_name] = orjson.loads(data)
+        return blob_name
+
+
+class TestWindowSectionChunks(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        heartbeat = patch("workers.indexer_activities.activity.heartbeat")
+        heartbeat.start()
+        self.addCleanup(heartbeat.stop)
+
+    def make_activities(self, storage: FakeAzureStorage) -> IndexerActivities:
+        with patch("workers.indexer_activities.WindowChunker", FakeWindowChunker):
+            return IndexerActivities({}, storage)
+
+    async def run_activity(
+        self, storage: FakeAzureStorage, urls: list[str]
+    ) -> list[str]:
+        activities = self.make_activities(storage)
+        return await activities.window_section_chunks("tenant", urls, "out")
+
+    def assert_linked(self, storage: FakeAzureStorage, result: list[str]):
+        chunk_ids = [storage.uploaded[path]["chunkId"] for path in result]
+        for i, path in enumerate(result):
+            chunk = storage.uploaded[path]
+            self.assertEqual(chunk["prevChunkId"], chunk_ids[i - 1] if i > 0 else "")
+            self.assertEqual(
+                chunk["nextChunkId"], chunk_ids[i + 1] if i + 1 < len(chunk_ids) else ""
+            )
+
+    async def test_links_chunks_across_sections_in_order(self):
+        sections = {f"s{i}": section_json(f"s{i}", 3) for i in range(20)}
+        storage = FakeAzureStorage(sections)
+
+        result = await self.run_activity(storage, list(sections))
+
+        self.assertEqual(
+            result,
+            [f"out/s{i}_{w}.chunk.json" for i in range(20) for w in range(3)],
+        )
+        self.assertEqual(set(storage.uploaded), set(result))
+        self.assertEqual(storage.containers, {"tenant"})
+        self.assert_linked(storage, result)
+
+    async def test_empty_input(self):
+        storage = FakeAzureStorage({})
+
+        result = await self.run_activity(storage, [])
+
+        self.assertEqual(result, [])
+        self.assertEqual(storage.uploaded, {})
+
+    async def test_sections_without_windows_are_skipped(self):
+        sections = {
+            "a": section_json("a", 0),
+            "b": section_json("b", 2),
+            "c": section_json("c", 0),
+            "d": section_json("d", 1),
+            "e": section_json("e", 0),
+        }
+        storage = FakeAzureStorage(sections)
+
+        result = await self.run_activity(storage, list(sections))
+
+        self.assertEqual(
+            result,
+            ["out/b_0.chunk.json", "out/b_1.chunk.json", "out/d_0.chunk.json"],
+        )
+        self.assert_linked(storage, result)
+
+    async def test_upload_failure_stops_processing(self):
+        sections = {f"s{i}": section_json(f"s{i}", 3) for i in range(40)}
+        storage = FakeAzureStorage(sections, fail_uploads=True)
+
+        with self.assertRaisesRegex(RuntimeError, "Upload failed"):
+            await self.run_activity(storage, list(sections))
+
+        self.assertLess(len(storage.downloaded), len(sections) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
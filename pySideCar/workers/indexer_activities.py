@@ -1,14 +1,19 @@
+import asyncio
 import io
 import logging
 import os
 import tempfile
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from itertools import islice
 from typing import Optional
 
 from temporalio import activity
 
 from azure_storage import AzureStorage
 
-from workers.indexer_types import parse_section_chunk_file, Chunk
+from workers.indexer_types import parse_section_chunk, Chunk
 from workers.window_chunker import WindowChunker
 
 # Set up logging
@@ -17,6 +22,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Max number of section downloads in flight or buffered ahead of chunking.
+DOWNLOAD_PREFETCH = 8
+# Number of concurrent upload workers.
+UPLOAD_CONCURRENCY = 16
+
 
 class IndexerActivities:
     def __init__(self, config: dict[str, str], azure_storage: AzureStorage):
@@ -46,44 +56,152 @@ class IndexerActivities:
             f"Processing {len(md_section_json_urls)} Markdown sections for tenant {tenant}"
         )
 
+        # Bounded so that slow or failing uploads push back on chunking
+        upload_queue: asyncio.Queue[Optional[tuple[str, bytes]]] = asyncio.Queue(
+            maxsize=2 * UPLOAD_CONCURRENCY
+        )
+
+        try:
+            # A failed upload cancels the task group, which stops the
+            # section loop at its next await
+            async with asyncio.TaskGroup() as uploads:
+                for _ in range(UPLOAD_CONCURRENCY):
+                    uploads.create_task(self._upload_worker(tenant, upload_queue))
+
+                result = await self._chunk_sections(
+                    tenant, md_section_json_urls, windows_output_path, upload_queue
+                )
+
+                for _ in range(UPLOAD_CONCURRENCY):
+                    await upload_queue.put(None)
+        except ExceptionGroup as eg:
+            # Surface the first failure itself rather than the group wrapper
+            raise eg.exceptions[0]
+
+        return result
+
+    async def _chunk_sections(
+        self,
+        tenant: str,
+        md_section_json_urls: list[str],
+        windows_output_path: str,
+        upload_queue: asyncio.Queue[Optional[tuple[str, bytes]]],
+    ) -> list[str]:
+        """
+        Chunk sections into linked windows, queueing each window for upload
+        once its neighbours are known.
+
+        Args:
+            tenant (str): The tenant identifier.
+            md_section_json_urls (list[str]): JSON URLs of the Markdown sections.
+            windows_output_path (str): Output path for the windowed chunks.
+            upload_queue (asyncio.Queue): Receives (blob path, payload) pairs.
+        Returns:
+            list[str]: Storage blob path of windows, in chunk order.
+        """
         result = []     # chunk blob paths
-        previous_last_chunk: Optional[Chunk] = None
-
-        for idx, md_section_json_url in enumerate(md_section_json_urls):
-            md_section_json_file = self._azure_storage.download_file(
-                tenant, md_section_json_url
-            )
-            md_section = parse_section_chunk_file(md_section_json_file)
-
-            # Process the sections into windowed chunks
-            for window_chunk in self.window_chunker.chunk_windows(md_section):
-                if previous_last_chunk is not None:
-                    # Link the previous chunk to the current one
-                    previous_last_chunk.nextChunkId = window_chunk.chunkId
-                    window_chunk.prevChunkId = previous_last_chunk.chunkId
-
-                    # Upload the previous chunk to Azure Blob Storage
-                    blob_path = f"{windows_output_path}/{previous_last_chunk.chunkId}.chunk.json"
-                    self._azure_storage.upload_bytes(
-                        tenant, blob_path, previous_last_chunk.to_json_bytes()
-                    )
+        last_chunk: Optional[Chunk] = None  # waiting on the next section for its nextChunkId
 
-                    result.append(blob_path)
+        async def enqueue_upload(chunk: Chunk) -> None:
+            blob_path = f"{windows_output_path}/{chunk.chunkId}.chunk.json"
+            await upload_queue.put((blob_path, chunk.to_json_bytes()))
+            result.append(blob_path)
 
-                # Update the previous chunk to the current one
-                previous_last_chunk = window_chunk
-            
-            activity.heartbeat({"progress": f"{idx+1}/{len(md_section_json_urls)}"})
-            logger.info(
-                f"Processed section {idx + 1}/{len(md_section_json_urls)}: {md_section.chunkId}"
-            )
+        # Sections arrive in order while later ones keep downloading
+        idx = 0
+        async with aclosing(
+            self._download_in_order(tenant, md_section_json_urls)
+        ) as md_section_jsons:
+            async for md_section_json in md_section_jsons:
+                md_section = parse_section_chunk(md_section_json)
+
+                # Process the sections into windowed chunks, continuing
+                # from the previous section's tail
+                chunks = [last_chunk] if last_chunk is not None else []
+                chunks.extend(self.window_chunker.chunk_windows(md_section))
+                _link_chunks(chunks)
+
+                # All but the last chunk are final; upload them while the
+                # remaining sections are processed
+                for chunk in chunks[:-1]:
+                    await enqueue_upload(chunk)
+                last_chunk = chunks[-1] if chunks else None
+
+                idx += 1
+                activity.heartbeat({"progress": f"{idx}/{len(md_section_json_urls)}"})
+                logger.info(
+                    f"Processed section {idx}/{len(md_section_json_urls)}: {md_section.chunkId}"
+                )
 
         # Handle the last chunk
-        if previous_last_chunk is not None:
-            blob_path = f"{windows_output_path}/{previous_last_chunk.chunkId}.chunk.json"
-            self._azure_storage.upload_bytes(
-                tenant, blob_path, previous_last_chunk.to_json_bytes()
-            )
-            result.append(blob_path)
+        if last_chunk is not None:
+            await enqueue_upload(last_chunk)
 
         return result
+
+    async def _download_in_order(
+        self, tenant: str, blob_names: list[str]
+    ) -> AsyncIterator[bytes]:
+        """
+        Download blobs concurrently, yielding their contents in input order.
+
+        At most DOWNLOAD_PREFETCH downloads are in flight or buffered ahead
+        of the consumer at any time.
+
+        Args:
+            tenant (str): The tenant identifier.
+            blob_names (list[str]): Blob paths to download.
+
+        Returns:
+            AsyncIterator[bytes]: Blob contents, in the order of `blob_names`.
+        """
+        remaining = iter(blob_names)
+        pending: deque[asyncio.Task[bytes]] = deque(
+            asyncio.create_task(self._azure_storage.download_bytes_async(tenant, name))
+            for name in islice(remaining, DOWNLOAD_PREFETCH)
+        )
+
+        try:
+            while pending:
+                data = await pending.popleft()
+
+                next_name = next(remaining, None)
+                if next_name is not None:
+                    pending.append(
+                        asyncio.create_task(
+                            self._azure_storage.download_bytes_async(tenant, next_name)
+                        )
+                    )
+                    # Let the new task start its download before the caller's
+                    # blocking work runs; otherwise only the downloads already
+                    # in flight would overlap it.
+                    await asyncio.sleep(0)
+
+                yield data
+        finally:
+            for task in pending:
+                task.cancel()
+            # Retrieve results so failed or cancelled downloads don't log
+            # "Task exception was never retrieved".
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _upload_worker(
+        self, tenant: str, queue: asyncio.Queue[Optional[tuple[str, bytes]]]
+    ) -> None:
+        """
+        Upload blobs from the queue until a None sentinel is received.
+
+        Args:
+            tenant (str): The tenant identifier.
+            queue (asyncio.Queue): Blob paths and their payloads.
+        """
+        while (item := await queue.get()) is not None:
+            blob_path, data = item
+            await self._azure_storage.upload_bytes_async(tenant, blob_path, data)
+
+
+def _link_chunks(chunks: list[Chunk]) -> None:
+    """Link consecutive chunks through their prev/next chunk ids."""
+    for prev_chunk, next_chunk in zip(chunks, chunks[1:]):
+        prev_chunk.nextChunkId = next_chunk.chunkId
+        next_chunk.prevChunkId = prev_chunk.chunkId
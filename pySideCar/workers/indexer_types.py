@@ -26,18 +26,15 @@ class Chunk:
         ) 
 
 
-def parse_section_chunk_file(file_path: str) -> Chunk:
+def parse_section_chunk(data: bytes) -> Chunk:
     """
-    Parse a JSON file containing chunk definitions into a list of Chunk objects.
+    Parse an in-memory JSON chunk definition into a Chunk object.
 
     Args:
-        file_path (str): Path to the JSON file containing chunk definitions.
+        data (bytes): Raw JSON bytes of a single section chunk.
 
     Returns:
-        Chunk: Chunk objects parsed from the file.
+        Chunk: Chunk object parsed from the data.
     """
-    import json
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        section_dict = json.load(f)
-        return Chunk(**section_dict)
+    section_dict = orjson.loads(data)
+    return Chunk(**section_dict)